@@ -0,0 +1,32 @@
+"""Store checksum_hash as BYTEA
+
+Revision ID: 9af825ef0df5
+Revises: 98be36776ed5
+Create Date: 2026-10-16 11:00:00
+
+"""
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9af825ef0df5"
+down_revision = "98be36776ed5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Store the raw 32-byte SHA-256 digest instead of its 64-char hex form."""
+    op.execute(
+        "ALTER TABLE prompt_versions ALTER COLUMN checksum_hash "
+        "TYPE BYTEA USING decode(checksum_hash, 'hex')"
+    )
+
+
+def downgrade() -> None:
+    """Restore hex-encoded TEXT checksums."""
+    op.execute(
+        "ALTER TABLE prompt_versions ALTER COLUMN checksum_hash "
+        "TYPE TEXT USING encode(checksum_hash, 'hex')"
+    )
@@ -225,7 +225,7 @@ async def get_prompt_history(
         versions.append(
             {
                 "version": version.version_number,
-                "template_hash": version.checksum_hash,
+                "template_hash": version.checksum_hash.hex(),
                 "template_source": version.template_source,
                 "created_at": version.created_at.isoformat(),
                 "execution_count": exec_count,
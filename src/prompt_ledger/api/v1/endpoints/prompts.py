@@ -4,7 +4,7 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Path
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from prompt_ledger.db.database import get_db
@@ -77,28 +77,26 @@ async def upsert_prompt(
     if existing_version:
         version = existing_version
     else:
-        # Get next version number
-        result = await db.execute(
-            select(PromptVersion.version_number)
+        # Compute next version number and create the version in one statement
+        next_version = (
+            select(func.coalesce(func.max(PromptVersion.version_number), 0) + 1)
             .where(PromptVersion.prompt_id == prompt.prompt_id)
-            .order_by(PromptVersion.version_number.desc())
-            .limit(1)
+            .scalar_subquery()
         )
-        max_version = result.scalar_one_or_none()
-        next_version = (max_version or 0) + 1
-
-        # Create new version
-        version = PromptVersion(
-            prompt_id=prompt.prompt_id,
-            version_number=next_version,
-            template_source=template_source,
-            checksum_hash=checksum,
-            created_by=created_by,
-            status="active" if set_active else "draft",
+        result = await db.scalars(
+            insert(PromptVersion)
+            .values(
+                prompt_id=prompt.prompt_id,
+                version_number=next_version,
+                template_source=template_source,
+                checksum_hash=checksum,
+                created_by=created_by,
+                status="active" if set_active else "draft",
+            )
+            .returning(PromptVersion)
         )
-        db.add(version)
+        version = result.one()
         version_change = True
-        await db.flush()
 
     # Set as active version if requested
     if set_active:
@@ -147,7 +145,7 @@ async def list_prompt_versions(
             "version_id": str(version.version_id),
             "version_number": version.version_number,
             "status": version.status,
-            "checksum_hash": version.checksum_hash,
+            "checksum_hash": version.checksum_hash.hex(),
             "created_by": version.created_by,
             "created_at": version.created_at.isoformat(),
         }
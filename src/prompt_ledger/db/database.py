@@ -1,16 +1,32 @@
 """Database connection and session management."""
 
-from sqlalchemy import create_engine
+from typing import Any
+
+import orjson
+from sqlalchemy import JSON, create_engine
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from prompt_ledger.settings import settings
 
+
+def json_serializer(value: Any) -> str:
+    """Serialize JSON column values with orjson."""
+    # OPT_NON_STR_KEYS keeps the stdlib behaviour of stringifying int keys
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create async engine for FastAPI
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     future=True,
+    json_serializer=json_serializer,
+    json_deserializer=orjson.loads,
+    # Keep hot lookups (e.g. prompts by name) prepared per connection so
+    # asyncpg skips re-planning them on every request.
+    connect_args={"statement_cache_size": 200, "prepared_statement_cache_size": 200},
 )
 
 # Create async session factory for FastAPI
@@ -29,6 +45,8 @@ sync_engine = create_engine(
     pool_pre_ping=True,  # Verify connections before using them
     pool_recycle=3600,  # Recycle connections after 1 hour
     connect_args={"options": "-c timezone=utc"},  # Ensure UTC timezone
+    json_serializer=json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # Create sync session factory for Celery workers
@@ -43,6 +61,9 @@ SyncSessionLocal = sessionmaker(
 # Base class for models
 Base = declarative_base()
 
+# JSONB on PostgreSQL, plain JSON on other backends (e.g. SQLite in tests)
+PortableJSONB = JSON().with_variant(JSONB(), "postgresql")
+
 
 async def get_db() -> AsyncSession:
     """Get database session."""
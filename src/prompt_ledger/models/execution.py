@@ -16,12 +16,12 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
 )
-from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, JSONB
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import desc, func
 
-from prompt_ledger.db.database import Base
+from prompt_ledger.db.database import Base, PortableJSONB
 
 
 class Execution(Base):
@@ -88,7 +88,9 @@ class Execution(Base):
         "ExecutionInput", back_populates="execution", uselist=False
     )
     # FR-001: Link to Span for workflow tracking
-    span = relationship("Span", back_populates="execution", uselist=False)
+    span = relationship(
+        "Span", back_populates="execution", uselist=False, lazy="raise_on_sql"
+    )
 
     # Indexes
     __table_args__ = (
@@ -114,7 +116,7 @@ class ExecutionInput(Base):
         ForeignKey("executions.execution_id"),
         primary_key=True,
     )
-    variables_json = Column(JSONB, nullable=False)
+    variables_json = Column(PortableJSONB, nullable=False)
 
     # Relationships
     execution = relationship("Execution", back_populates="execution_input")
@@ -1,9 +1,12 @@
 """Prompt and prompt version models."""
 
+import functools
 import hashlib
+import os
+import time
 from datetime import datetime
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import (
     TEXT,
@@ -14,7 +17,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
-    String,
+    LargeBinary,
     UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
@@ -24,9 +27,29 @@ from sqlalchemy.sql import func
 from prompt_ledger.db.database import Base
 
 
-def compute_checksum(template_source: str) -> str:
-    """Compute SHA-256 checksum of template source."""
-    return hashlib.sha256(template_source.encode("utf-8")).hexdigest()
+@functools.lru_cache(maxsize=1024)
+def compute_checksum(template_source: str) -> bytes:
+    """Compute raw 32-byte SHA-256 checksum of template source."""
+    return hashlib.sha256(template_source.encode("utf-8")).digest()
+
+
+def compute_checksum_hex(template_source: str) -> str:
+    """Compute SHA-256 checksum of template source as a hex string."""
+    return compute_checksum(template_source).hex()
+
+
+def uuid7() -> UUID:
+    """Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits are the Unix time in milliseconds, so new rows land
+    on the rightmost leaf of the primary key B-tree instead of a random page.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 9562 variant
+    return UUID(int=value)
 
 
 class Prompt(Base):
@@ -34,7 +57,7 @@ class Prompt(Base):
 
     __tablename__ = "prompts"
 
-    prompt_id = Column(PostgresUUID(as_uuid=True), primary_key=True, default=uuid4)
+    prompt_id = Column(PostgresUUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(TEXT, nullable=False, unique=True)
     description = Column(TEXT)
     owner_team = Column(TEXT)
@@ -84,16 +107,18 @@ class PromptVersion(Base):
 
     __tablename__ = "prompt_versions"
 
-    version_id = Column(PostgresUUID(as_uuid=True), primary_key=True, default=uuid4)
+    version_id = Column(PostgresUUID(as_uuid=True), primary_key=True, default=uuid7)
     prompt_id = Column(
         PostgresUUID(as_uuid=True), ForeignKey("prompts.prompt_id"), nullable=False
     )
     version_number = Column(Integer, nullable=False)
     status = Column(
-        String(20), nullable=False, default="draft"
-    )  # draft, active, deprecated
+        Enum("draft", "active", "deprecated", name="prompt_version_status"),
+        nullable=False,
+        default="draft",
+    )
     template_source = Column(TEXT, nullable=False)
-    checksum_hash = Column(TEXT, nullable=False)
+    checksum_hash = Column(LargeBinary(32), nullable=False)
     created_by = Column(TEXT)
     created_at = Column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
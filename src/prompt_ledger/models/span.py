@@ -5,12 +5,11 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
-from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import backref, relationship
 from sqlalchemy.sql import func
 
-from prompt_ledger.db.database import Base
+from prompt_ledger.db.database import Base, PortableJSONB
 
 
 class Span(Base):
@@ -53,9 +52,9 @@ class Span(Base):
     error_message = Column(Text, nullable=True)
 
     # Flexible content (JSONB for arbitrary data)
-    input_data = Column(JSONB, nullable=True)  # Input to this operation
-    output_data = Column(JSONB, nullable=True)  # Output from this operation
-    attributes = Column(JSONB, nullable=True)  # Arbitrary metadata
+    input_data = Column(PortableJSONB, nullable=True)  # Input to this operation
+    output_data = Column(PortableJSONB, nullable=True)  # Output from this operation
+    attributes = Column(PortableJSONB, nullable=True)  # Arbitrary metadata
 
     # LLM-specific fields (only populated for LLM spans)
     model = Column(String(100), nullable=True)
@@ -71,16 +70,21 @@ class Span(Base):
     )
 
     # Relationships
+    # Span relationships must be loaded explicitly (selectinload/refresh):
+    # an implicit lazy load that would emit SQL raises instead.
     # Self-referential for parent-child tree
     parent_span = relationship(
         "Span",
         remote_side=[span_id],
         foreign_keys=[parent_span_id],
-        backref="child_spans",
+        backref=backref("child_spans", lazy="raise_on_sql"),
+        lazy="raise_on_sql",
     )
 
     # Link to Execution (when this span represents a PromptLedger execution)
-    execution = relationship("Execution", back_populates="span", uselist=False)
+    execution = relationship(
+        "Execution", back_populates="span", uselist=False, lazy="raise_on_sql"
+    )
 
     # Indexes for query performance
     __table_args__ = (
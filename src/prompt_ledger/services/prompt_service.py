@@ -1,10 +1,10 @@
 """Prompt service for managing prompts across both modes."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from prompt_ledger.models.prompt import Prompt, PromptVersion, compute_checksum
@@ -34,6 +34,10 @@ class PromptService:
         is returned. If changed, a new version is created with an incremented
         version number.
 
+        The whole batch is handled with a fixed number of statements: one
+        lookup per table, one bulk INSERT each for new prompts and new
+        versions, and a single commit.
+
         Args:
             prompts: List of prompt data dictionaries containing:
                 - name: Prompt identifier (str)
@@ -57,91 +61,115 @@ class PromptService:
             {'name': 'WELCOME', 'mode': 'tracking', 'version': 1,
              'change_detected': False, 'previous_version': None}
         """
+        if not prompts:
+            return []
+
+        # Hash the whole batch in one pass before touching the database
+        checksums = [compute_checksum(p["template_source"]) for p in prompts]
+        names = list(dict.fromkeys(p["name"] for p in prompts))
+
+        # Fetch every prompt in the batch with a single query
+        result = await self.db.execute(select(Prompt).where(Prompt.name.in_(names)))
+        prompts_by_name = {prompt.name: prompt for prompt in result.scalars()}
+        existing_ids = [prompt.prompt_id for prompt in prompts_by_name.values()]
+
+        # Create all missing prompts in tracking mode with one bulk INSERT
+        created_names = {name for name in names if name not in prompts_by_name}
+        if created_names:
+            result = await self.db.scalars(
+                insert(Prompt).returning(Prompt),
+                [
+                    {"name": name, "mode": "tracking"}
+                    for name in names
+                    if name in created_names
+                ],
+            )
+            prompts_by_name.update({prompt.name: prompt for prompt in result})
+
+        # Load version numbers of existing prompts with one query
+        version_by_checksum: Dict[Tuple[UUID, bytes], int] = {}
+        max_version: Dict[UUID, int] = {}
+        if existing_ids:
+            result = await self.db.execute(
+                select(
+                    PromptVersion.prompt_id,
+                    PromptVersion.checksum_hash,
+                    PromptVersion.version_number,
+                ).where(PromptVersion.prompt_id.in_(existing_ids))
+            )
+            for prompt_id, checksum_hash, version_number in result:
+                version_by_checksum[(prompt_id, checksum_hash)] = version_number
+                max_version[prompt_id] = max(
+                    max_version.get(prompt_id, 0), version_number
+                )
+
         results = []
+        new_versions = []
 
-        for prompt_data in prompts:
+        for prompt_data, checksum in zip(prompts, checksums):
             name = prompt_data["name"]
-            template_source = prompt_data["template_source"]
-            checksum = compute_checksum(template_source)
-
-            # Find or create prompt
-            result = await self.db.execute(select(Prompt).where(Prompt.name == name))
-            prompt = result.scalar_one_or_none()
+            prompt = prompts_by_name[name]
+            key = (prompt.prompt_id, checksum)
 
             previous_version = None
             change_detected = False
+            version_number = version_by_checksum.get(key)
 
-            if not prompt:
-                # Create new prompt in tracking mode
-                prompt = Prompt(name=name, mode="tracking")
-                self.db.add(prompt)
-                await self.db.flush()
-
-                # Create version 1
-                version = PromptVersion(
-                    prompt_id=prompt.prompt_id,
-                    version_number=1,
-                    template_source=template_source,
-                    checksum_hash=checksum,
-                    status="active",
-                )
-                self.db.add(version)
-                await self.db.flush()
-
-                # Set as active version
-                prompt.active_version_id = version.version_id
-
-            else:
-                # Prompt exists - check if checksum already exists
-                result = await self.db.execute(
-                    select(PromptVersion).where(
-                        PromptVersion.prompt_id == prompt.prompt_id,
-                        PromptVersion.checksum_hash == checksum,
-                    )
-                )
-                existing_version = result.scalar_one_or_none()
-
-                if existing_version:
-                    # Content unchanged - return existing version
-                    version = existing_version
+            if version_number is None:
+                if name in created_names and prompt.prompt_id not in max_version:
+                    # First version of a prompt created by this call
+                    version_number = 1
                 else:
                     # Content changed - create new version
-                    result = await self.db.execute(
-                        select(PromptVersion.version_number)
-                        .where(PromptVersion.prompt_id == prompt.prompt_id)
-                        .order_by(PromptVersion.version_number.desc())
-                        .limit(1)
-                    )
-                    max_version = result.scalar_one_or_none()
-                    previous_version = max_version
-                    next_version = (max_version or 0) + 1
-
-                    version = PromptVersion(
-                        prompt_id=prompt.prompt_id,
-                        version_number=next_version,
-                        template_source=template_source,
-                        checksum_hash=checksum,
-                        status="active",
-                    )
-                    self.db.add(version)
-                    await self.db.flush()
-
-                    # Update active version
-                    prompt.active_version_id = version.version_id
+                    previous_version = max_version.get(prompt.prompt_id)
+                    version_number = (previous_version or 0) + 1
                     change_detected = True
 
-            await self.db.commit()
+                new_versions.append(
+                    {
+                        "prompt_id": prompt.prompt_id,
+                        "version_number": version_number,
+                        "template_source": prompt_data["template_source"],
+                        "checksum_hash": checksum,
+                        "status": "active",
+                    }
+                )
+                version_by_checksum[key] = version_number
+                max_version[prompt.prompt_id] = version_number
 
             results.append(
                 {
                     "name": name,
                     "mode": "tracking",
-                    "version": version.version_number,
+                    "version": version_number,
                     "change_detected": change_detected,
                     "previous_version": previous_version,
                 }
             )
 
+        if new_versions:
+            result = await self.db.execute(
+                insert(PromptVersion).returning(
+                    PromptVersion.prompt_id,
+                    PromptVersion.version_id,
+                    PromptVersion.version_number,
+                ),
+                new_versions,
+            )
+
+            # The newest version of each prompt becomes its active version
+            active_versions: Dict[UUID, Tuple[int, UUID]] = {}
+            for prompt_id, version_id, version_number in result:
+                current = active_versions.get(prompt_id)
+                if current is None or version_number > current[0]:
+                    active_versions[prompt_id] = (version_number, version_id)
+
+            for prompt in prompts_by_name.values():
+                if prompt.prompt_id in active_versions:
+                    prompt.active_version_id = active_versions[prompt.prompt_id][1]
+
+        await self.db.commit()
+
         return results
 
     async def validate_mode(
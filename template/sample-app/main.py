@@ -1,9 +1,9 @@
 import os
+from contextlib import asynccontextmanager
 
 import httpx
-from fastapi import FastAPI
-
-app = FastAPI()
+import orjson
+from fastapi import FastAPI, Response
 
 # PromptLedger API configuration
 PROMPT_LEDGER_URL = os.getenv("PROMPT_LEDGER_URL", "http://prompt-ledger-api:8000")
@@ -11,34 +11,56 @@ PROMPT_LEDGER_API_KEY = os.getenv(
     "PROMPT_LEDGER_API_KEY", "dev-key-change-in-production"
 )
 
+# Connection pool sized for bursty /welcome fan-outs. Idle connections are
+# kept alive long enough to avoid re-handshaking between bursts.
+HTTP_LIMITS = httpx.Limits(
+    max_connections=256,
+    max_keepalive_connections=64,
+    keepalive_expiry=300.0,
+)
+
 
-@app.on_event("startup")
-async def startup_event():
+async def create_sample_prompt(client: httpx.AsyncClient) -> None:
     """Create a sample prompt on startup."""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{PROMPT_LEDGER_URL}/v1/prompts/user_welcome",
-                headers={"X-API-Key": PROMPT_LEDGER_API_KEY},
-                json={
-                    "description": "Welcome message for new users",
-                    "owner_team": "product",
-                    "template_source": "Hello {{name}}! Welcome to {{app_name}}.",
-                    "created_by": "sample-app",
-                    "set_active": True,
-                },
-                timeout=10.0,
-            )
-            if response.status_code in (200, 201):
-                print("Prompt 'user_welcome' created or already exists.")
-            else:
-                print(
-                    f"Could not create prompt: {response.status_code} - {response.text}"
-                )
+        response = await client.put(
+            "/v1/prompts/user_welcome",
+            json={
+                "description": "Welcome message for new users",
+                "owner_team": "product",
+                "template_source": "Hello {{name}}! Welcome to {{app_name}}.",
+                "created_by": "sample-app",
+                "set_active": True,
+            },
+            timeout=10.0,
+        )
+        if response.status_code in (200, 201):
+            print("Prompt 'user_welcome' created or already exists.")
+        else:
+            print(f"Could not create prompt: {response.status_code} - {response.text}")
     except Exception as e:
         print(f"Error connecting to PromptLedger API: {e}")
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Share one pooled HTTP client across all requests."""
+    # Limits must be set on the transport: the client ignores its own
+    # ``limits`` argument when an explicit transport is supplied.
+    transport = httpx.AsyncHTTPTransport(retries=1, limits=HTTP_LIMITS)
+    async with httpx.AsyncClient(
+        base_url=PROMPT_LEDGER_URL,
+        headers={"X-API-Key": PROMPT_LEDGER_API_KEY},
+        transport=transport,
+    ) as client:
+        app.state.http_client = client
+        await create_sample_prompt(client)
+        yield
+
+
+app = FastAPI(lifespan=lifespan)
+
+
 @app.get("/")
 def read_root():
     return {"message": "Sample App is running. Use /welcome to test PromptLedger."}
@@ -47,28 +69,33 @@ def read_root():
 @app.get("/welcome")
 async def send_welcome_message():
     """Execute a prompt via PromptLedger API."""
+    client: httpx.AsyncClient = app.state.http_client
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{PROMPT_LEDGER_URL}/v1/executions:run",
-                headers={"X-API-Key": PROMPT_LEDGER_API_KEY},
-                json={
-                    "prompt_name": "user_welcome",
-                    "environment": "production",
-                    "variables": {"name": "New User", "app_name": "Our Awesome App"},
-                    "model": {"provider": "openai", "model_name": "gpt-4o-mini"},
-                    "params": {"temperature": 0.7, "max_tokens": 100},
-                },
-                timeout=30.0,
-            )
+        response = await client.post(
+            "/v1/executions:run",
+            json={
+                "prompt_name": "user_welcome",
+                "environment": "production",
+                "variables": {"name": "New User", "app_name": "Our Awesome App"},
+                "model": {"provider": "openai", "model_name": "gpt-4o-mini"},
+                "params": {"temperature": 0.7, "max_tokens": 100},
+            },
+            timeout=30.0,
+        )
 
-            if response.status_code == 200:
-                result = response.json()
-                return {"welcome_message": result.get("response_text")}
-            else:
-                return {
-                    "error": f"API error: {response.status_code}",
-                    "details": response.text,
-                }
+        if response.status_code == 200:
+            # Upstream and client shapes differ only by the renamed field, so
+            # parse and re-encode with orjson instead of going through
+            # FastAPI's jsonable_encoder.
+            result = orjson.loads(response.content)
+            return Response(
+                content=orjson.dumps({"welcome_message": result.get("response_text")}),
+                media_type="application/json",
+            )
+        else:
+            return {
+                "error": f"API error: {response.status_code}",
+                "details": response.text,
+            }
     except Exception as e:
         return {"error": str(e)}
@@ -4,7 +4,13 @@ import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from prompt_ledger.models.prompt import Prompt, PromptVersion, compute_checksum
+from prompt_ledger.models.prompt import (
+    Prompt,
+    PromptVersion,
+    compute_checksum,
+    compute_checksum_hex,
+)
+from tests.templates import HELLO, HELLO_HASH, HI, HI_HASH
 
 
 @pytest.fixture
@@ -25,8 +31,7 @@ async def full_prompt(db_session: AsyncSession):
     await db_session.flush()
 
     prompt.active_version_id = version.version_id
-    await db_session.commit()
-    await db_session.refresh(prompt)
+    await db_session.flush()
     return prompt
 
 
@@ -48,32 +53,29 @@ async def tracking_prompt(db_session: AsyncSession):
     await db_session.flush()
 
     prompt.active_version_id = version.version_id
-    await db_session.commit()
-    await db_session.refresh(prompt)
+    await db_session.flush()
     return prompt
 
 
 class TestRegisterCodePrompts:
     """Test POST /v1/prompts/register-code endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_register_new_code_prompts(self, client: AsyncClient):
+    async def test_register_new_code_prompts(self, post_json):
         """Test registering new code-based prompts."""
         # Arrange
-        template = "Hello {{name}}!"
         payload = {
             "prompts": [
                 {
                     "name": "WELCOME",
-                    "template_source": template,
-                    "template_hash": compute_checksum(template),
+                    "template_source": HELLO,
+                    "template_hash": HELLO_HASH,
                 }
             ]
         }
 
         # Act
-        response = await client.post(
-            "/v1/prompts/register-code", json=payload, headers={"X-API-Key": "test-key"}
+        response = await post_json(
+            "/v1/prompts/register-code", payload, headers={"X-API-Key": "test-key"}
         )
 
         # Assert
@@ -86,36 +88,31 @@ class TestRegisterCodePrompts:
         assert data["registered"][0]["version"] == 1
         assert data["registered"][0]["change_detected"] is False
 
-    @pytest.mark.asyncio
-    async def test_register_detects_content_changes(self, client: AsyncClient):
+    async def test_register_detects_content_changes(self, post_json):
         """Test change detection on re-registration."""
-        # Arrange
-        template_v1 = "Hello {{name}}!"
-        template_v2 = "Hi {{name}}, welcome!"
-
         # Act - Register twice with different content
-        await client.post(
+        await post_json(
             "/v1/prompts/register-code",
-            json={
+            {
                 "prompts": [
                     {
                         "name": "WELCOME",
-                        "template_source": template_v1,
-                        "template_hash": compute_checksum(template_v1),
+                        "template_source": HELLO,
+                        "template_hash": HELLO_HASH,
                     }
                 ]
             },
             headers={"X-API-Key": "test-key"},
         )
 
-        response = await client.post(
+        response = await post_json(
             "/v1/prompts/register-code",
-            json={
+            {
                 "prompts": [
                     {
                         "name": "WELCOME",
-                        "template_source": template_v2,
-                        "template_hash": compute_checksum(template_v2),
+                        "template_source": HI,
+                        "template_hash": HI_HASH,
                     }
                 ]
             },
@@ -129,29 +126,25 @@ class TestRegisterCodePrompts:
         assert data["registered"][0]["change_detected"] is True
         assert data["registered"][0]["previous_version"] == 1
 
-    @pytest.mark.asyncio
-    async def test_register_unchanged_prompt_returns_same_version(
-        self, client: AsyncClient
-    ):
+    async def test_register_unchanged_prompt_returns_same_version(self, post_json):
         """Test re-registering unchanged prompt doesn't create new version."""
         # Arrange
-        template = "Hello {{name}}!"
         payload = {
             "prompts": [
                 {
                     "name": "STABLE",
-                    "template_source": template,
-                    "template_hash": compute_checksum(template),
+                    "template_source": HELLO,
+                    "template_hash": HELLO_HASH,
                 }
             ]
         }
 
         # Act - Register twice with same content
-        response1 = await client.post(
-            "/v1/prompts/register-code", json=payload, headers={"X-API-Key": "test-key"}
+        response1 = await post_json(
+            "/v1/prompts/register-code", payload, headers={"X-API-Key": "test-key"}
         )
-        response2 = await client.post(
-            "/v1/prompts/register-code", json=payload, headers={"X-API-Key": "test-key"}
+        response2 = await post_json(
+            "/v1/prompts/register-code", payload, headers={"X-API-Key": "test-key"}
         )
 
         # Assert
@@ -163,8 +156,7 @@ class TestRegisterCodePrompts:
         assert data2["registered"][0]["version"] == 1  # Same version
         assert data2["registered"][0]["change_detected"] is False
 
-    @pytest.mark.asyncio
-    async def test_register_multiple_prompts(self, client: AsyncClient):
+    async def test_register_multiple_prompts(self, post_json):
         """Test registering multiple prompts in one request."""
         # Arrange
         payload = {
@@ -172,19 +164,19 @@ class TestRegisterCodePrompts:
                 {
                     "name": "WELCOME",
                     "template_source": "Hello!",
-                    "template_hash": compute_checksum("Hello!"),
+                    "template_hash": compute_checksum_hex("Hello!"),
                 },
                 {
                     "name": "GOODBYE",
                     "template_source": "Bye!",
-                    "template_hash": compute_checksum("Bye!"),
+                    "template_hash": compute_checksum_hex("Bye!"),
                 },
             ]
         }
 
         # Act
-        response = await client.post(
-            "/v1/prompts/register-code", json=payload, headers={"X-API-Key": "test-key"}
+        response = await post_json(
+            "/v1/prompts/register-code", payload, headers={"X-API-Key": "test-key"}
         )
 
         # Assert
@@ -194,15 +186,14 @@ class TestRegisterCodePrompts:
         assert data["registered"][0]["name"] == "WELCOME"
         assert data["registered"][1]["name"] == "GOODBYE"
 
-    @pytest.mark.asyncio
-    async def test_register_empty_list_returns_400(self, client: AsyncClient):
+    async def test_register_empty_list_returns_400(self, post_json):
         """Test registering empty list returns error."""
         # Arrange
         payload = {"prompts": []}
 
         # Act
-        response = await client.post(
-            "/v1/prompts/register-code", json=payload, headers={"X-API-Key": "test-key"}
+        response = await post_json(
+            "/v1/prompts/register-code", payload, headers={"X-API-Key": "test-key"}
         )
 
         # Assert
@@ -213,9 +204,8 @@ class TestRegisterCodePrompts:
 class TestExecuteCodePrompt:
     """Test POST /v1/prompts/{name}/execute endpoint."""
 
-    @pytest.mark.asyncio
     async def test_execute_tracking_mode_prompt_sync(
-        self, client: AsyncClient, tracking_prompt: Prompt, seed_models
+        self, post_json, tracking_prompt: Prompt, seed_models
     ):
         """Test executing a tracking mode prompt synchronously."""
         # Arrange
@@ -226,9 +216,9 @@ class TestExecuteCodePrompt:
         }
 
         # Act
-        response = await client.post(
+        response = await post_json(
             f"/v1/prompts/{tracking_prompt.name}/execute",
-            json=payload,
+            payload,
             headers={"X-API-Key": "test-key"},
         )
 
@@ -239,10 +229,7 @@ class TestExecuteCodePrompt:
         assert data.get("prompt_mode") == "tracking"
         assert data.get("status") in ["succeeded", "queued"]
 
-    @pytest.mark.asyncio
-    async def test_execute_full_mode_prompt_fails(
-        self, client: AsyncClient, full_prompt: Prompt
-    ):
+    async def test_execute_full_mode_prompt_fails(self, post_json, full_prompt: Prompt):
         """Test executing full mode prompt via code endpoint fails."""
         # Arrange
         payload = {
@@ -252,9 +239,9 @@ class TestExecuteCodePrompt:
         }
 
         # Act
-        response = await client.post(
+        response = await post_json(
             f"/v1/prompts/{full_prompt.name}/execute",
-            json=payload,
+            payload,
             headers={"X-API-Key": "test-key"},
         )
 
@@ -264,8 +251,7 @@ class TestExecuteCodePrompt:
         assert "full mode" in detail.lower()
         assert "PUT" in detail  # Should suggest correct endpoint
 
-    @pytest.mark.asyncio
-    async def test_execute_nonexistent_prompt_returns_404(self, client: AsyncClient):
+    async def test_execute_nonexistent_prompt_returns_404(self, post_json):
         """Test executing non-existent prompt returns 404."""
         # Arrange
         payload = {
@@ -275,9 +261,9 @@ class TestExecuteCodePrompt:
         }
 
         # Act
-        response = await client.post(
+        response = await post_json(
             "/v1/prompts/nonexistent/execute",
-            json=payload,
+            payload,
             headers={"X-API-Key": "test-key"},
         )
 
@@ -289,7 +275,6 @@ class TestExecuteCodePrompt:
 class TestPromptHistory:
     """Test GET /v1/prompts/{name}/history endpoint."""
 
-    @pytest.mark.asyncio
     async def test_get_tracking_mode_history(
         self, client: AsyncClient, tracking_prompt: Prompt
     ):
@@ -309,7 +294,6 @@ class TestPromptHistory:
         assert len(data["versions"]) == 1
         assert data["versions"][0]["version"] == 1
 
-    @pytest.mark.asyncio
     async def test_get_full_mode_history(
         self, client: AsyncClient, full_prompt: Prompt
     ):
@@ -326,7 +310,6 @@ class TestPromptHistory:
         assert data["prompt_name"] == full_prompt.name
         assert data["mode"] == "full"
 
-    @pytest.mark.asyncio
     async def test_history_includes_execution_counts(
         self, client: AsyncClient, tracking_prompt: Prompt
     ):
@@ -355,5 +338,5 @@ async def seed_models(db_session: AsyncSession):
         supports_streaming=False,
     )
     db_session.add(model)
-    await db_session.commit()
+    await db_session.flush()
     return model
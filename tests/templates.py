@@ -0,0 +1,10 @@
+"""Prompt templates shared by the test modules, hashed once at import time."""
+
+from prompt_ledger.models.prompt import compute_checksum_hex
+
+HELLO = "Hello {{name}}!"
+HELLO_HASH = compute_checksum_hex(HELLO)
+HI = "Hi {{name}}, welcome!"
+HI_HASH = compute_checksum_hex(HI)
+GOODBYE = "Goodbye {{name}}!"
+GOODBYE_HASH = compute_checksum_hex(GOODBYE)
@@ -1,12 +1,11 @@
 """Tests for database models."""
 
-from uuid import uuid4
-
-import pytest
+import time
+from uuid import RFC_4122
 
 from prompt_ledger.models.execution import Execution, ExecutionInput
 from prompt_ledger.models.model import Model
-from prompt_ledger.models.prompt import Prompt, PromptVersion, compute_checksum
+from prompt_ledger.models.prompt import Prompt, PromptVersion, compute_checksum, uuid7
 
 
 class TestPromptModel:
@@ -19,7 +18,17 @@ class TestPromptModel:
         checksum2 = compute_checksum(template)
 
         assert checksum1 == checksum2
-        assert len(checksum1) == 64  # SHA-256 hex length
+        assert len(checksum1) == 32  # SHA-256 digest length
+
+    def test_uuid7_is_time_ordered(self):
+        """Test prompt IDs are version 7 UUIDs that sort by creation time."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+
+        assert first.version == 7
+        assert first.variant == RFC_4122
+        assert first < second
 
     async def test_prompt_creation(self, db_session):
         """Test creating a prompt."""
@@ -29,7 +38,7 @@ class TestPromptModel:
             owner_team="AI-Platform",
         )
         db_session.add(prompt)
-        await db_session.commit()
+        await db_session.flush()
 
         assert prompt.prompt_id is not None
         assert prompt.name == "test_prompt"
@@ -51,7 +60,7 @@ class TestPromptModel:
             status="active",
         )
         db_session.add(version)
-        await db_session.commit()
+        await db_session.flush()
 
         assert version.version_id is not None
         assert version.version_number == 1
@@ -105,7 +114,7 @@ class TestExecutionModel:
             variables_json={"name": "World"},
         )
         db_session.add(execution_input)
-        await db_session.commit()
+        await db_session.flush()
 
         assert execution.execution_id is not None
         assert execution.status == "succeeded"
@@ -125,7 +134,7 @@ class TestModel:
             supports_streaming=True,
         )
         db_session.add(model)
-        await db_session.commit()
+        await db_session.flush()
 
         assert model.model_id is not None
         assert model.provider == "openai"
@@ -1,6 +1,5 @@
 """Tests for prompt management endpoints."""
 
-import pytest
 from httpx import AsyncClient
 
 
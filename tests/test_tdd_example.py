@@ -10,7 +10,7 @@ This is the ONLY way we develop features in this project.
 
 import pytest
 
-from prompt_ledger.models.prompt import compute_checksum
+from prompt_ledger.models.prompt import compute_checksum, compute_checksum_hex
 
 
 class TestTDDExample:
@@ -28,16 +28,17 @@ class TestTDDExample:
         template = "Hello {{name}}, welcome to {{place}}!"
 
         # Act & Assert - Now this passes with correct implementation
-        checksum = compute_checksum(template)
+        checksum = compute_checksum_hex(template)
 
         # Real SHA-256 hash for this specific template
         expected = "865bf6664dbd9f05e93aecca3e3bc4b3a25755b7fdcc401fb4bfbc72f81db81b"
 
         assert checksum == expected, f"Expected {expected}, got {checksum}"
         assert len(checksum) == 64, "Checksum should be 64 characters (SHA-256)"
-        assert all(
-            c in "0123456789abcdef" for c in checksum
-        ), "Checksum should be hexadecimal"
+        try:
+            bytes.fromhex(checksum)
+        except ValueError:
+            pytest.fail("Checksum should be hexadecimal")
 
     def test_checksum_is_deterministic(self):
         """RED PHASE: Test that same input always produces same checksum."""
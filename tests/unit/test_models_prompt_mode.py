@@ -1,7 +1,6 @@
 """Test prompt mode functionality."""
 
-import pytest
-from sqlalchemy import select, text
+from sqlalchemy import inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from prompt_ledger.models.prompt import Prompt, PromptVersion, compute_checksum
@@ -10,33 +9,22 @@ from prompt_ledger.models.prompt import Prompt, PromptVersion, compute_checksum
 class TestPromptMode:
     """Test prompt mode field and operations."""
 
-    @pytest.mark.asyncio
-    async def test_prompt_defaults_to_full_mode(self, db_session: AsyncSession):
+    async def test_prompt_defaults_to_full_mode(self, insert_and_return):
         """Test that new prompts default to 'full' mode."""
         # Arrange & Act
-        prompt = Prompt(name="test_prompt", description="Test")
-        db_session.add(prompt)
-        await db_session.commit()
-        await db_session.refresh(prompt)
+        prompt = await insert_and_return(Prompt, name="test_prompt", description="Test")
 
         # Assert
         assert prompt.mode == "full", "New prompts should default to 'full' mode"
 
-    @pytest.mark.asyncio
-    async def test_prompt_can_be_created_with_tracking_mode(
-        self, db_session: AsyncSession
-    ):
+    async def test_prompt_can_be_created_with_tracking_mode(self, insert_and_return):
         """Test creating prompt in tracking mode."""
         # Arrange & Act
-        prompt = Prompt(name="code_prompt", mode="tracking")
-        db_session.add(prompt)
-        await db_session.commit()
-        await db_session.refresh(prompt)
+        prompt = await insert_and_return(Prompt, name="code_prompt", mode="tracking")
 
         # Assert
         assert prompt.mode == "tracking", "Prompt mode should be 'tracking'"
 
-    @pytest.mark.asyncio
     async def test_prompt_mode_can_be_queried(self, db_session: AsyncSession):
         """Test querying prompts by mode."""
         # Arrange
@@ -44,7 +32,7 @@ class TestPromptMode:
         tracking_prompt = Prompt(name="tracking_prompt", mode="tracking")
         db_session.add(full_prompt)
         db_session.add(tracking_prompt)
-        await db_session.commit()
+        await db_session.flush()
 
         # Act - Query full mode prompts
         result = await db_session.execute(select(Prompt).where(Prompt.mode == "full"))
@@ -64,38 +52,28 @@ class TestPromptMode:
         assert len(tracking_prompts) == 1
         assert tracking_prompts[0].name == "tracking_prompt"
 
-    @pytest.mark.asyncio
     async def test_mode_index_exists(self, db_session: AsyncSession):
         """Test that mode index exists for query optimization."""
-        # Act - Query information_schema to check index existence
-        result = await db_session.execute(
-            text(
-                "SELECT indexname FROM pg_indexes "
-                "WHERE tablename = 'prompts' AND indexname = 'idx_prompts_mode'"
-            )
-        )
-        index = result.scalar_one_or_none()
+        # Act - Reflect indexes on the prompts table
+        conn = await db_session.connection()
+        indexes = await conn.run_sync(lambda c: inspect(c).get_indexes("prompts"))
 
         # Assert
-        assert index == "idx_prompts_mode", "Mode index should exist for performance"
+        assert any(
+            idx["name"] == "idx_prompts_mode" for idx in indexes
+        ), "Mode index should exist for performance"
 
-    @pytest.mark.asyncio
     async def test_mode_field_not_nullable(self, db_session: AsyncSession):
         """Test that mode field cannot be null."""
         # This test verifies the migration set nullable=False
-        # Query column metadata
-        result = await db_session.execute(
-            text(
-                "SELECT is_nullable FROM information_schema.columns "
-                "WHERE table_name = 'prompts' AND column_name = 'mode'"
-            )
-        )
-        is_nullable = result.scalar_one_or_none()
+        # Reflect column metadata
+        conn = await db_session.connection()
+        columns = await conn.run_sync(lambda c: inspect(c).get_columns("prompts"))
+        mode_column = next(col for col in columns if col["name"] == "mode")
 
         # Assert
-        assert is_nullable == "NO", "Mode field should be NOT NULL"
+        assert mode_column["nullable"] is False, "Mode field should be NOT NULL"
 
-    @pytest.mark.asyncio
     async def test_full_and_tracking_prompts_can_have_same_version_structure(
         self, db_session: AsyncSession
     ):
@@ -124,19 +102,19 @@ class TestPromptMode:
         )
         db_session.add(full_version)
         db_session.add(tracking_version)
-        await db_session.commit()
+        await db_session.flush()
 
         # Assert - Both should work with same version table
-        result = await db_session.execute(
+        version = await db_session.scalar(
             select(PromptVersion).where(
                 PromptVersion.prompt_id == full_prompt.prompt_id
             )
         )
-        assert result.scalar_one() is not None
+        assert version is not None
 
-        result = await db_session.execute(
+        version = await db_session.scalar(
             select(PromptVersion).where(
                 PromptVersion.prompt_id == tracking_prompt.prompt_id
             )
         )
-        assert result.scalar_one() is not None
+        assert version is not None
@@ -2,26 +2,34 @@
 
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from prompt_ledger.models.prompt import Prompt, PromptVersion, compute_checksum
+from prompt_ledger.models.prompt import (
+    Prompt,
+    PromptVersion,
+    compute_checksum,
+    compute_checksum_hex,
+)
 from prompt_ledger.services.prompt_service import PromptService
+from tests.templates import GOODBYE, GOODBYE_HASH, HELLO, HELLO_HASH, HI, HI_HASH
+
+# Parameterised so every lookup reuses the same compiled statement
+SELECT_PROMPT_BY_NAME = select(Prompt).where(Prompt.name == bindparam("name"))
 
 
 class TestPromptServiceCodeBased:
     """Test code-based prompt registration."""
 
-    @pytest.mark.asyncio
     async def test_register_new_code_prompt(self, db_session: AsyncSession):
         """Test registering a new code-based prompt."""
         # Arrange
         service = PromptService(db_session)
-        template = "Hello {{name}}!"
         prompts_data = [
             {
                 "name": "WELCOME",
-                "template_source": template,
-                "template_hash": compute_checksum(template),
+                "template_source": HELLO,
+                "template_hash": HELLO_HASH,
             }
         ]
 
@@ -36,19 +44,17 @@ class TestPromptServiceCodeBased:
         assert result[0]["change_detected"] is False  # First registration
         assert result[0]["previous_version"] is None
 
-    @pytest.mark.asyncio
     async def test_register_unchanged_prompt_no_new_version(
         self, db_session: AsyncSession
     ):
         """Test re-registering unchanged prompt doesn't create new version."""
         # Arrange
         service = PromptService(db_session)
-        template = "Hello {{name}}!"
         prompts_data = [
             {
                 "name": "WELCOME",
-                "template_source": template,
-                "template_hash": compute_checksum(template),
+                "template_source": HELLO,
+                "template_hash": HELLO_HASH,
             }
         ]
 
@@ -62,23 +68,20 @@ class TestPromptServiceCodeBased:
         assert result2[0]["change_detected"] is False
         assert result2[0]["previous_version"] is None
 
-    @pytest.mark.asyncio
     async def test_register_changed_prompt_creates_new_version(
         self, db_session: AsyncSession
     ):
         """Test changing template content creates new version."""
         # Arrange
         service = PromptService(db_session)
-        template_v1 = "Hello {{name}}!"
-        template_v2 = "Hi {{name}}, welcome!"
 
         # Act - Register, then update
         result1 = await service.register_code_prompts(
             [
                 {
                     "name": "WELCOME",
-                    "template_source": template_v1,
-                    "template_hash": compute_checksum(template_v1),
+                    "template_source": HELLO,
+                    "template_hash": HELLO_HASH,
                 }
             ]
         )
@@ -87,8 +90,8 @@ class TestPromptServiceCodeBased:
             [
                 {
                     "name": "WELCOME",
-                    "template_source": template_v2,
-                    "template_hash": compute_checksum(template_v2),
+                    "template_source": HI,
+                    "template_hash": HI_HASH,
                 }
             ]
         )
@@ -99,7 +102,6 @@ class TestPromptServiceCodeBased:
         assert result2[0]["change_detected"] is True
         assert result2[0]["previous_version"] == 1
 
-    @pytest.mark.asyncio
     async def test_register_multiple_prompts_at_once(self, db_session: AsyncSession):
         """Test registering multiple prompts in one call."""
         # Arrange
@@ -107,13 +109,13 @@ class TestPromptServiceCodeBased:
         prompts_data = [
             {
                 "name": "WELCOME",
-                "template_source": "Hello {{name}}!",
-                "template_hash": compute_checksum("Hello {{name}}!"),
+                "template_source": HELLO,
+                "template_hash": HELLO_HASH,
             },
             {
                 "name": "GOODBYE",
-                "template_source": "Goodbye {{name}}!",
-                "template_hash": compute_checksum("Goodbye {{name}}!"),
+                "template_source": GOODBYE,
+                "template_hash": GOODBYE_HASH,
             },
         ]
 
@@ -127,7 +129,6 @@ class TestPromptServiceCodeBased:
         assert result[1]["name"] == "GOODBYE"
         assert result[1]["version"] == 1
 
-    @pytest.mark.asyncio
     async def test_register_prompt_sets_tracking_mode(self, db_session: AsyncSession):
         """Test that registered prompts are set to tracking mode."""
         # Arrange
@@ -136,7 +137,7 @@ class TestPromptServiceCodeBased:
             {
                 "name": "CODE_PROMPT",
                 "template_source": "Test {{var}}",
-                "template_hash": compute_checksum("Test {{var}}"),
+                "template_hash": compute_checksum_hex("Test {{var}}"),
             }
         ]
 
@@ -144,15 +145,9 @@ class TestPromptServiceCodeBased:
         await service.register_code_prompts(prompts_data)
 
         # Assert - Query database to verify mode
-        from sqlalchemy import select
-
-        result = await db_session.execute(
-            select(Prompt).where(Prompt.name == "CODE_PROMPT")
-        )
-        prompt = result.scalar_one()
+        prompt = await db_session.scalar(SELECT_PROMPT_BY_NAME, {"name": "CODE_PROMPT"})
         assert prompt.mode == "tracking"
 
-    @pytest.mark.asyncio
     async def test_register_sets_active_version(self, db_session: AsyncSession):
         """Test that registered prompt has active version set."""
         # Arrange
@@ -161,7 +156,7 @@ class TestPromptServiceCodeBased:
             {
                 "name": "ACTIVE_TEST",
                 "template_source": "Test",
-                "template_hash": compute_checksum("Test"),
+                "template_hash": compute_checksum_hex("Test"),
             }
         ]
 
@@ -169,40 +164,33 @@ class TestPromptServiceCodeBased:
         await service.register_code_prompts(prompts_data)
 
         # Assert
-        from sqlalchemy import select
-
-        result = await db_session.execute(
-            select(Prompt).where(Prompt.name == "ACTIVE_TEST")
-        )
-        prompt = result.scalar_one()
+        prompt = await db_session.scalar(SELECT_PROMPT_BY_NAME, {"name": "ACTIVE_TEST"})
         assert prompt.active_version_id is not None
 
 
 class TestModeValidation:
     """Test mode validation logic."""
 
-    @pytest.mark.asyncio
-    async def test_validate_full_mode_prompt(self, db_session: AsyncSession):
+    async def test_validate_full_mode_prompt(
+        self, db_session: AsyncSession, insert_and_return
+    ):
         """Test validating full mode prompt."""
         # Arrange
         service = PromptService(db_session)
-        prompt = Prompt(name="full_prompt", mode="full")
-        db_session.add(prompt)
-        await db_session.commit()
+        await insert_and_return(Prompt, name="full_prompt", mode="full")
 
         # Act & Assert - Should not raise
         result = await service.validate_mode("full_prompt", "full", "PUT operation")
         assert result.name == "full_prompt"
         assert result.mode == "full"
 
-    @pytest.mark.asyncio
-    async def test_validate_tracking_mode_prompt(self, db_session: AsyncSession):
+    async def test_validate_tracking_mode_prompt(
+        self, db_session: AsyncSession, insert_and_return
+    ):
         """Test validating tracking mode prompt."""
         # Arrange
         service = PromptService(db_session)
-        prompt = Prompt(name="tracking_prompt", mode="tracking")
-        db_session.add(prompt)
-        await db_session.commit()
+        await insert_and_return(Prompt, name="tracking_prompt", mode="tracking")
 
         # Act & Assert - Should not raise
         result = await service.validate_mode(
@@ -211,14 +199,13 @@ class TestModeValidation:
         assert result.name == "tracking_prompt"
         assert result.mode == "tracking"
 
-    @pytest.mark.asyncio
-    async def test_validate_mode_mismatch_raises_error(self, db_session: AsyncSession):
+    async def test_validate_mode_mismatch_raises_error(
+        self, db_session: AsyncSession, insert_and_return
+    ):
         """Test mode mismatch raises HTTPException."""
         # Arrange
         service = PromptService(db_session)
-        prompt = Prompt(name="tracking_prompt", mode="tracking")
-        db_session.add(prompt)
-        await db_session.commit()
+        await insert_and_return(Prompt, name="tracking_prompt", mode="tracking")
 
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
@@ -228,16 +215,13 @@ class TestModeValidation:
         assert "tracking" in exc_info.value.detail.lower()
         assert "code-based" in exc_info.value.detail.lower()
 
-    @pytest.mark.asyncio
     async def test_validate_full_mode_mismatch_error_message(
-        self, db_session: AsyncSession
+        self, db_session: AsyncSession, insert_and_return
     ):
         """Test error message for full mode prompt accessed via code endpoint."""
         # Arrange
         service = PromptService(db_session)
-        prompt = Prompt(name="full_prompt", mode="full")
-        db_session.add(prompt)
-        await db_session.commit()
+        await insert_and_return(Prompt, name="full_prompt", mode="full")
 
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
@@ -247,7 +231,6 @@ class TestModeValidation:
         assert "full mode" in exc_info.value.detail.lower()
         assert "PUT" in exc_info.value.detail
 
-    @pytest.mark.asyncio
     async def test_validate_nonexistent_prompt_raises_404(
         self, db_session: AsyncSession
     ):
@@ -266,7 +249,6 @@ class TestModeValidation:
 class TestEdgeCases:
     """Test edge cases and error conditions."""
 
-    @pytest.mark.asyncio
     async def test_register_empty_list_returns_empty(self, db_session: AsyncSession):
         """Test registering empty list returns empty result."""
         # Arrange
@@ -278,7 +260,6 @@ class TestEdgeCases:
         # Assert
         assert result == []
 
-    @pytest.mark.asyncio
     async def test_version_increment_handles_gaps(self, db_session: AsyncSession):
         """Test version numbering is sequential even with manual version creation."""
         # Arrange
@@ -304,7 +285,7 @@ class TestEdgeCases:
         )
         db_session.add(version1)
         db_session.add(version3)
-        await db_session.commit()
+        await db_session.flush()
 
         # Act - Register new version
         result = await service.register_code_prompts(
@@ -312,7 +293,7 @@ class TestEdgeCases:
                 {
                     "name": "gap_test",
                     "template_source": "v4",
-                    "template_hash": compute_checksum("v4"),
+                    "template_hash": compute_checksum_hex("v4"),
                 }
             ]
         )
@@ -1,44 +1,87 @@
 """Unit tests for Span model - TDD approach for FR-001."""
 
-from datetime import datetime
+from typing import Any, Dict
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import inspect, select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy import bindparam, inspect, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from prompt_ledger.models.execution import Execution
 from prompt_ledger.models.model import Model
-from prompt_ledger.models.prompt import Prompt, PromptVersion, compute_checksum
+from prompt_ledger.models.prompt import (
+    Prompt,
+    PromptVersion,
+    compute_checksum,
+    uuid7,
+)
 from prompt_ledger.models.span import Span
 
+_TEMPLATE = "Test template"
 
-class TestSpanTableSchema:
-    """Test Span table schema and structure."""
+SELECT_SPANS_BY_TRACE = select(Span).where(Span.trace_id == bindparam("trace_id"))
 
-    @pytest.mark.asyncio
-    async def test_span_table_exists(self, db_session: AsyncSession):
-        """Test that spans table exists in database."""
 
-        def get_tables(sync_conn):
-            inspector = inspect(sync_conn)
-            return inspector.get_table_names()
+@pytest.fixture(scope="module")
+async def span_schema(test_engine: AsyncEngine) -> Dict[str, Any]:
+    """Reflect the spans table once for all schema tests in this module."""
 
-        conn = await db_session.connection()
-        tables = await conn.run_sync(get_tables)
-        assert "spans" in tables, "spans table should exist"
+    def reflect(sync_conn) -> Dict[str, Any]:
+        inspector = inspect(sync_conn)
+        return {
+            "tables": inspector.get_table_names(),
+            "columns": {col["name"] for col in inspector.get_columns("spans")},
+            "indexes": {idx["name"] for idx in inspector.get_indexes("spans")},
+        }
 
-    @pytest.mark.asyncio
-    async def test_span_table_has_required_columns(self, db_session: AsyncSession):
-        """Test that spans table has all required columns."""
+    async with test_engine.connect() as conn:
+        return await conn.run_sync(reflect)
+
+
+@pytest.fixture
+async def execution_graph(db_session: AsyncSession) -> Execution:
+    """Create a Prompt -> PromptVersion -> Model -> Execution graph in one flush."""
+    # Primary keys are assigned up front so foreign keys can be wired
+    # before anything is sent to the database.
+    prompt = Prompt(prompt_id=uuid7(), name="span_test_prompt", mode="full")
+    version = PromptVersion(
+        version_id=uuid7(),
+        prompt_id=prompt.prompt_id,
+        version_number=1,
+        template_source=_TEMPLATE,
+        checksum_hash=compute_checksum(_TEMPLATE),
+        status="active",
+    )
+    model = Model(
+        model_id=uuid4(),
+        provider="openai",
+        model_name="gpt-4o-mini",
+        max_tokens=128000,
+        supports_streaming=True,
+    )
+    execution = Execution(
+        prompt_id=prompt.prompt_id,
+        version_id=version.version_id,
+        model_id=model.model_id,
+        execution_mode="sync",
+        status="succeeded",
+        rendered_prompt="Test prompt",
+    )
+    db_session.add_all([prompt, version, model, execution])
+    await db_session.flush()
+    return execution
+
+
+class TestSpanTableSchema:
+    """Test Span table schema and structure."""
 
-        def get_columns(sync_conn):
-            inspector = inspect(sync_conn)
-            return {col["name"] for col in inspector.get_columns("spans")}
+    def test_span_table_exists(self, span_schema: Dict[str, Any]):
+        """Test that spans table exists in database."""
+        assert "spans" in span_schema["tables"], "spans table should exist"
 
-        conn = await db_session.connection()
-        columns = await conn.run_sync(get_columns)
+    def test_span_table_has_required_columns(self, span_schema: Dict[str, Any]):
+        """Test that spans table has all required columns."""
+        columns = span_schema["columns"]
 
         required_columns = {
             "span_id",
@@ -64,16 +107,9 @@ class TestSpanTableSchema:
             columns
         ), f"Missing columns: {required_columns - columns}"
 
-    @pytest.mark.asyncio
-    async def test_span_table_has_indexes(self, db_session: AsyncSession):
+    def test_span_table_has_indexes(self, span_schema: Dict[str, Any]):
         """Test that spans table has proper indexes for performance."""
-
-        def get_indexes(sync_conn):
-            inspector = inspect(sync_conn)
-            return {idx["name"] for idx in inspector.get_indexes("spans")}
-
-        conn = await db_session.connection()
-        indexes = await conn.run_sync(get_indexes)
+        indexes = span_schema["indexes"]
 
         # Should have index on trace_id for fast trace queries
         assert any(
@@ -84,174 +120,136 @@ class TestSpanTableSchema:
 class TestSpanModelCreation:
     """Test creating Span model instances."""
 
-    @pytest.mark.asyncio
-    async def test_create_minimal_span(self, db_session: AsyncSession):
-        """Test creating a span with minimal required fields."""
-        span = Span(
-            trace_id="trace-abc123", name="test_operation", kind="llm.generation"
-        )
+    @pytest.mark.parametrize(
+        "span_kwargs",
+        [
+            pytest.param(
+                {
+                    "trace_id": "trace-abc123",
+                    "name": "test_operation",
+                    "kind": "llm.generation",
+                },
+                id="minimal",
+            ),
+            pytest.param(
+                {
+                    "trace_id": "trace-123",
+                    "name": "generate_response",
+                    "kind": "llm.generation",
+                    "model": "gpt-4o",
+                    "prompt_tokens": 150,
+                    "completion_tokens": 80,
+                    "duration_ms": 450,
+                },
+                id="llm_with_tokens",
+            ),
+            pytest.param(
+                {
+                    "trace_id": "trace-456",
+                    "name": "web_search",
+                    "kind": "tool.search",
+                    "input_data": {"query": "Albert Einstein", "max_results": 3},
+                    "output_data": {
+                        "results": [{"title": "Einstein", "snippet": "..."}]
+                    },
+                    "duration_ms": 230,
+                    "attributes": {"search_engine": "wikipedia", "api_version": "2.0"},
+                },
+                id="tool",
+            ),
+            pytest.param(
+                {
+                    "trace_id": "trace-789",
+                    "name": "failed_operation",
+                    "kind": "llm.generation",
+                    "status": "error",
+                    "error_message": "OpenAI API rate limit exceeded",
+                },
+                id="failed",
+            ),
+        ],
+    )
+    async def test_create_span(
+        self, db_session: AsyncSession, span_kwargs: Dict[str, Any]
+    ):
+        """Test creating spans of each shape stores the given fields."""
+        span = Span(**span_kwargs)
 
         db_session.add(span)
-        await db_session.commit()
+        await db_session.flush()
 
         assert span.span_id is not None
-        assert span.trace_id == "trace-abc123"
-        assert span.name == "test_operation"
-        assert span.kind == "llm.generation"
-        assert span.status == "ok"  # Default value
-
-    @pytest.mark.asyncio
-    async def test_create_llm_span_with_tokens(self, db_session: AsyncSession):
-        """Test creating an LLM span with token counts."""
-        span = Span(
-            trace_id="trace-123",
-            name="generate_response",
-            kind="llm.generation",
-            model="gpt-4o",
-            prompt_tokens=150,
-            completion_tokens=80,
-            duration_ms=450,
-        )
-
-        db_session.add(span)
-        await db_session.commit()
-
-        assert span.model == "gpt-4o"
-        assert span.prompt_tokens == 150
-        assert span.completion_tokens == 80
-        assert span.duration_ms == 450
-
-    @pytest.mark.asyncio
-    async def test_create_tool_span(self, db_session: AsyncSession):
-        """Test creating a tool call span."""
-        span = Span(
-            trace_id="trace-456",
-            name="web_search",
-            kind="tool.search",
-            input_data={"query": "Albert Einstein", "max_results": 3},
-            output_data={"results": [{"title": "Einstein", "snippet": "..."}]},
-            duration_ms=230,
-            attributes={"search_engine": "wikipedia", "api_version": "2.0"},
-        )
-
-        db_session.add(span)
-        await db_session.commit()
-
-        assert span.kind == "tool.search"
-        assert span.input_data["query"] == "Albert Einstein"
-        assert span.output_data["results"][0]["title"] == "Einstein"
-        assert span.attributes["search_engine"] == "wikipedia"
-
-    @pytest.mark.asyncio
-    async def test_create_failed_span(self, db_session: AsyncSession):
-        """Test creating a span with error status."""
-        span = Span(
-            trace_id="trace-789",
-            name="failed_operation",
-            kind="llm.generation",
-            status="error",
-            error_message="OpenAI API rate limit exceeded",
-        )
-
-        db_session.add(span)
-        await db_session.commit()
-
-        assert span.status == "error"
-        assert span.error_message == "OpenAI API rate limit exceeded"
+        for field, value in span_kwargs.items():
+            assert getattr(span, field) == value
+        assert span.status == span_kwargs.get("status", "ok")  # Default value
 
 
 class TestSpanParentChildRelationship:
     """Test self-referential parent-child relationships between spans."""
 
-    @pytest.mark.asyncio
     async def test_parent_child_relationship(self, db_session: AsyncSession):
         """Test that parent-child relationship works correctly."""
-        parent = Span(trace_id="trace-1", name="parent_span", kind="llm.generation")
-        db_session.add(parent)
-        await db_session.flush()
-
+        # IDs are assigned client-side so the whole tree goes in one flush
+        parent = Span(
+            span_id=uuid4(),
+            trace_id="trace-1",
+            name="parent_span",
+            kind="llm.generation",
+        )
         child = Span(
             trace_id="trace-1",
             name="child_span",
             kind="llm.guardrail",
             parent_span_id=parent.span_id,
         )
-        db_session.add(child)
+        db_session.add_all([parent, child])
         await db_session.commit()
 
-        # Reload with eager loading of relationships
-        result = await db_session.execute(
-            select(Span)
-            .options(selectinload(Span.parent_span), selectinload(Span.child_spans))
-            .where(Span.span_id == parent.span_id)
-        )
-        parent_reloaded = result.scalar_one()
-
-        result = await db_session.execute(
-            select(Span)
-            .options(selectinload(Span.parent_span))
-            .where(Span.span_id == child.span_id)
-        )
-        child_reloaded = result.scalar_one()
+        # Load just the relationships on the instances already in the session
+        await db_session.refresh(parent, attribute_names=["child_spans"])
+        await db_session.refresh(child, attribute_names=["parent_span"])
 
-        assert child_reloaded.parent_span_id == parent.span_id
-        assert child_reloaded.parent_span == parent_reloaded
-        assert child_reloaded in parent_reloaded.child_spans
+        assert child.parent_span_id == parent.span_id
+        assert child.parent_span is parent
+        assert child in parent.child_spans
 
-    @pytest.mark.asyncio
     async def test_linear_chain_three_spans(self, db_session: AsyncSession):
         """Test linear chain: A → B → C."""
-        span_a = Span(trace_id="trace-chain", name="A", kind="llm")
-        db_session.add(span_a)
-        await db_session.flush()
-
+        span_a = Span(span_id=uuid4(), trace_id="trace-chain", name="A", kind="llm")
         span_b = Span(
-            trace_id="trace-chain", name="B", kind="tool", parent_span_id=span_a.span_id
+            span_id=uuid4(),
+            trace_id="trace-chain",
+            name="B",
+            kind="tool",
+            parent_span_id=span_a.span_id,
         )
-        db_session.add(span_b)
-        await db_session.flush()
-
         span_c = Span(
             trace_id="trace-chain", name="C", kind="llm", parent_span_id=span_b.span_id
         )
-        db_session.add(span_c)
+        db_session.add_all([span_a, span_b, span_c])
         await db_session.commit()
 
-        # Reload with eager loading
-        result = await db_session.execute(
-            select(Span)
-            .options(selectinload(Span.child_spans))
-            .where(Span.span_id == span_a.span_id)
-        )
-        span_a_reloaded = result.scalar_one()
-
-        result = await db_session.execute(
-            select(Span)
-            .options(selectinload(Span.child_spans), selectinload(Span.parent_span))
-            .where(Span.span_id == span_b.span_id)
-        )
-        span_b_reloaded = result.scalar_one()
-
-        result = await db_session.execute(
-            select(Span)
-            .options(selectinload(Span.parent_span))
-            .where(Span.span_id == span_c.span_id)
+        # Load the whole trace in one query and rebuild the tree in Python
+        result = await db_session.scalars(
+            SELECT_SPANS_BY_TRACE, {"trace_id": "trace-chain"}
         )
-        span_c_reloaded = result.scalar_one()
+        spans = result.all()
+        by_id = {span.span_id: span for span in spans}
+        children = {}
+        for span in spans:
+            children.setdefault(span.parent_span_id, []).append(span.name)
 
         # Verify chain
-        assert len(span_a_reloaded.child_spans) == 1
-        assert span_a_reloaded.child_spans[0].name == "B"
-        assert len(span_b_reloaded.child_spans) == 1
-        assert span_b_reloaded.child_spans[0].name == "C"
-        assert span_c_reloaded.parent_span.name == "B"
+        assert children == {
+            None: ["A"],
+            span_a.span_id: ["B"],
+            span_b.span_id: ["C"],
+        }
+        assert by_id[span_c.parent_span_id].name == "B"
 
-    @pytest.mark.asyncio
     async def test_parallel_fanout(self, db_session: AsyncSession):
         """Test parallel pattern: A → [B, C, D]."""
-        span_a = Span(trace_id="trace-parallel", name="A", kind="llm")
-        db_session.add(span_a)
-        await db_session.flush()
+        span_a = Span(span_id=uuid4(), trace_id="trace-parallel", name="A", kind="llm")
 
         span_b = Span(
             trace_id="trace-parallel",
@@ -272,22 +270,21 @@ class TestSpanParentChildRelationship:
             parent_span_id=span_a.span_id,
         )
 
-        db_session.add_all([span_b, span_c, span_d])
+        db_session.add_all([span_a, span_b, span_c, span_d])
         await db_session.commit()
 
-        # Reload with eager loading
-        result = await db_session.execute(
-            select(Span)
-            .options(selectinload(Span.child_spans))
-            .where(Span.span_id == span_a.span_id)
+        # Load the whole trace in one query
+        result = await db_session.scalars(
+            SELECT_SPANS_BY_TRACE, {"trace_id": "trace-parallel"}
         )
-        span_a_reloaded = result.scalar_one()
+        spans = result.all()
 
-        assert len(span_a_reloaded.child_spans) == 3
-        child_names = {child.name for child in span_a_reloaded.child_spans}
+        assert len(spans) == 4
+        child_names = {
+            span.name for span in spans if span.parent_span_id == span_a.span_id
+        }
         assert child_names == {"B", "C", "D"}
 
-    @pytest.mark.asyncio
     async def test_multiple_traces_isolated(self, db_session: AsyncSession):
         """Test that spans from different traces are properly isolated."""
         # Trace 1
@@ -301,7 +298,7 @@ class TestSpanParentChildRelationship:
 
         # Query spans by trace_id
         result = await db_session.execute(
-            select(Span).where(Span.trace_id == "trace-1")
+            SELECT_SPANS_BY_TRACE, {"trace_id": "trace-1"}
         )
         trace1_spans = result.scalars().all()
 
@@ -312,7 +309,6 @@ class TestSpanParentChildRelationship:
 class TestSpanExecutionLinking:
     """Test linking between Span and Execution models."""
 
-    @pytest.mark.asyncio
     async def test_span_without_execution(self, db_session: AsyncSession):
         """Test creating a span not linked to any execution (e.g., tool call)."""
         span = Span(
@@ -328,45 +324,11 @@ class TestSpanExecutionLinking:
         assert span.execution_id is None
         assert span.execution is None
 
-    @pytest.mark.asyncio
-    async def test_span_linked_to_execution(self, db_session: AsyncSession):
+    async def test_span_linked_to_execution(
+        self, db_session: AsyncSession, execution_graph: Execution
+    ):
         """Test creating a span linked to a PromptLedger execution."""
-        # Create necessary related objects
-        prompt = Prompt(name=f"test_prompt_{uuid4()}", description="Test", mode="full")
-        db_session.add(prompt)
-        await db_session.flush()
-
-        template = "Test template"
-        version = PromptVersion(
-            prompt_id=prompt.prompt_id,
-            version_number=1,
-            template_source=template,
-            checksum_hash=compute_checksum(template),
-            status="active",
-        )
-        db_session.add(version)
-        await db_session.flush()
-
-        model = Model(
-            provider="openai",
-            model_name="gpt-4o-mini",
-            max_tokens=128000,
-            supports_streaming=True,
-        )
-        db_session.add(model)
-        await db_session.flush()
-
-        # Create execution
-        execution = Execution(
-            prompt_id=prompt.prompt_id,
-            version_id=version.version_id,
-            model_id=model.model_id,
-            execution_mode="sync",
-            status="succeeded",
-            rendered_prompt="Test prompt",
-        )
-        db_session.add(execution)
-        await db_session.flush()
+        execution = execution_graph
 
         # Create linked span
         span = Span(
@@ -381,58 +343,20 @@ class TestSpanExecutionLinking:
         db_session.add(span)
         await db_session.commit()
 
-        # Reload with eager loading
-        result = await db_session.execute(
-            select(Execution)
-            .options(selectinload(Execution.span))
-            .where(Execution.execution_id == execution.execution_id)
-        )
-        execution_reloaded = result.scalar_one()
-
-        result = await db_session.execute(
-            select(Span)
-            .options(selectinload(Span.execution))
-            .where(Span.span_id == span.span_id)
-        )
-        span_reloaded = result.scalar_one()
+        # Load just the relationships on the instances already in the session
+        await db_session.refresh(execution, attribute_names=["span"])
+        await db_session.refresh(span, attribute_names=["execution"])
 
         # Verify bidirectional relationship
-        assert span_reloaded.execution_id == execution.execution_id
-        assert span_reloaded.execution.execution_id == execution_reloaded.execution_id
-        assert execution_reloaded.span.span_id == span_reloaded.span_id
+        assert span.execution_id == execution.execution_id
+        assert span.execution is execution
+        assert execution.span is span
 
-    @pytest.mark.asyncio
-    async def test_execution_can_have_at_most_one_span(self, db_session: AsyncSession):
+    async def test_execution_can_have_at_most_one_span(
+        self, db_session: AsyncSession, execution_graph: Execution
+    ):
         """Test that an execution can have at most one linked span (1:1 relationship)."""
-        # Create execution
-        prompt = Prompt(name=f"test_{uuid4()}", mode="full")
-        db_session.add(prompt)
-        await db_session.flush()
-
-        version = PromptVersion(
-            prompt_id=prompt.prompt_id,
-            version_number=1,
-            template_source="Test",
-            checksum_hash=compute_checksum("Test"),
-            status="active",
-        )
-        db_session.add(version)
-        await db_session.flush()
-
-        model = Model(provider="openai", model_name="gpt-4o", max_tokens=128000)
-        db_session.add(model)
-        await db_session.flush()
-
-        execution = Execution(
-            prompt_id=prompt.prompt_id,
-            version_id=version.version_id,
-            model_id=model.model_id,
-            execution_mode="sync",
-            status="succeeded",
-            rendered_prompt="Test",
-        )
-        db_session.add(execution)
-        await db_session.flush()
+        execution = execution_graph
 
         # Create first span
         span1 = Span(
@@ -444,65 +368,29 @@ class TestSpanExecutionLinking:
         db_session.add(span1)
         await db_session.commit()
 
-        # Reload with eager loading
-        result = await db_session.execute(
-            select(Execution)
-            .options(selectinload(Execution.span))
-            .where(Execution.execution_id == execution.execution_id)
-        )
-        execution_reloaded = result.scalar_one()
+        await db_session.refresh(execution, attribute_names=["span"])
 
         # Verify single span relationship
-        assert execution_reloaded.span.name == "span1"
+        assert execution.span.name == "span1"
 
 
 class TestSpanKindValues:
     """Test valid span kind values based on OpenTelemetry conventions."""
 
-    @pytest.mark.asyncio
-    async def test_llm_generation_kind(self, db_session: AsyncSession):
-        """Test LLM generation span kind."""
-        span = Span(trace_id="t1", name="generate", kind="llm.generation")
+    @pytest.mark.parametrize(
+        ("name", "kind"),
+        [
+            ("generate", "llm.generation"),
+            ("check", "llm.guardrail"),
+            ("embed", "llm.embedding"),
+            ("search", "tool.search"),
+            ("vector_search", "db.query"),
+            ("plan_action", "agent.reasoning"),
+        ],
+    )
+    async def test_span_kind(self, db_session: AsyncSession, name: str, kind: str):
+        """Test each supported span kind is stored as given."""
+        span = Span(trace_id="t1", name=name, kind=kind)
         db_session.add(span)
-        await db_session.commit()
-        assert span.kind == "llm.generation"
-
-    @pytest.mark.asyncio
-    async def test_llm_guardrail_kind(self, db_session: AsyncSession):
-        """Test LLM guardrail span kind."""
-        span = Span(trace_id="t1", name="check", kind="llm.guardrail")
-        db_session.add(span)
-        await db_session.commit()
-        assert span.kind == "llm.guardrail"
-
-    @pytest.mark.asyncio
-    async def test_llm_embedding_kind(self, db_session: AsyncSession):
-        """Test LLM embedding span kind."""
-        span = Span(trace_id="t1", name="embed", kind="llm.embedding")
-        db_session.add(span)
-        await db_session.commit()
-        assert span.kind == "llm.embedding"
-
-    @pytest.mark.asyncio
-    async def test_tool_kind(self, db_session: AsyncSession):
-        """Test tool span kind."""
-        span = Span(trace_id="t1", name="search", kind="tool.search")
-        db_session.add(span)
-        await db_session.commit()
-        assert span.kind == "tool.search"
-
-    @pytest.mark.asyncio
-    async def test_db_query_kind(self, db_session: AsyncSession):
-        """Test database query span kind."""
-        span = Span(trace_id="t1", name="vector_search", kind="db.query")
-        db_session.add(span)
-        await db_session.commit()
-        assert span.kind == "db.query"
-
-    @pytest.mark.asyncio
-    async def test_agent_reasoning_kind(self, db_session: AsyncSession):
-        """Test agent reasoning span kind."""
-        span = Span(trace_id="t1", name="plan_action", kind="agent.reasoning")
-        db_session.add(span)
-        await db_session.commit()
-        assert span.kind == "agent.reasoning"
+        await db_session.flush()
+        assert span.kind == kind